@@ -0,0 +1,33 @@
+"""
+Numba-compiled kernels backing the batch helpers in session20.
+
+Each kernel fuses its arithmetic into a single parallel loop. When numba is
+not installed the kernels are set to None and callers fall back to plain
+numpy expressions.
+"""
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def areas(r):
+        """Compute π * r^2 for every radius in r."""
+        out = np.empty_like(r)
+        for i in prange(r.size):
+            out[i] = 3.141592653589793 * r[i] * r[i]
+        return out
+
+    @njit(parallel=True, cache=True)
+    def salaries(base, bonus):
+        """Compute base + base * (bonus / 100) for every base/bonus pair."""
+        out = np.empty(base.size, dtype=np.float64)
+        for i in prange(base.size):
+            out[i] = base[i] + base[i] * (bonus[i] / 100.0)
+        return out
+else:
+    areas = None
+    salaries = None
@@ -1,6 +1,10 @@
 import pytest
+import session20
 from session20 import Person, Circle, Vehicle, ElectricVehicle, DynamicClass, ValidatedAttribute
 
+class Real(float):
+    """A float subclass standing in for types such as numpy.float64."""
+
 def test_person():
     person = Person('John', 'Doe', 1990)
     assert person.age == 34  # Assuming the current year is 2024
@@ -14,6 +18,16 @@ def test_person():
     assert person.base_salary == 60000
     assert person.salary == 66000  # Updated salary
 
+def test_person_full_name():
+    person = Person()
+    person.full_name = "John  Ronald\t Tolkien"
+    assert person.first_name == "John"
+    assert person.last_name == "Ronald Tolkien"
+    assert person.full_name == "John Ronald Tolkien"
+    with pytest.raises(ValueError):
+        person.full_name = "Solo"
+    assert Person(5, 'Doe').full_name == "5 Doe"
+
 def test_circle():
     circle = Circle(10)
     assert circle.radius == 10
@@ -24,6 +38,25 @@ def test_circle():
     assert circle.area == pytest.approx(78.539, 0.001)
     with pytest.raises(ValueError):
         circle.radius = -1  # Should raise an error for negative radius
+    with pytest.raises(ValueError):
+        circle.diameter = -2  # Should raise an error for negative diameter
+    circle.diameter = Real(3.0)
+    assert circle.radius == 1.5
+
+def test_area_memo(tmp_path, monkeypatch):
+    path = str(tmp_path / "areas.json")
+    session20.enable_area_memo(path)
+    try:
+        assert Circle(3).area == pytest.approx(28.274, 0.001)
+        session20._save_area_memo()
+        session20.enable_area_memo(path)
+        assert 3 in session20._AREA_MEMO
+        monkeypatch.setattr(session20, "_AREA_MEMO_MAXSIZE", 2)
+        for r in (1, 2, 1, 4):
+            Circle(r).area
+        assert list(session20._AREA_MEMO) == [1, 4]
+    finally:
+        session20.disable_area_memo()
 
 def test_vehicle():
     vehicle = Vehicle('Toyota', 'Corolla', 2020)
@@ -36,10 +69,24 @@ def test_dynamic_class():
     dynamic_obj = DynamicClass()
     dynamic_obj.dynamic_attr('name', 'Dynamic Object')
     assert dynamic_obj.name == 'Dynamic Object'
+    dynamic_obj.dynamic_attr('static_value', 5)
+    assert dynamic_obj.static_value == 5
+    assert DynamicClass.static_value == 0
 
 def test_validated_attribute():
     validated_attr = ValidatedAttribute()
     validated_attr.value = 100
     assert validated_attr.value == 100
     with pytest.raises(ValueError):
-        validated_attr.value = -10  # Should raise error for negative value
\ No newline at end of file
+        validated_attr.value = -10  # Should raise error for negative value
+    validated_attr.value = Real(2.5)  # float subclasses (e.g. numpy.float64) are accepted
+    assert validated_attr.value == 2.5
+
+def test_batch_helpers():
+    pytest.importorskip("numpy")
+    people = [Person('A', 'B', 1990) for _ in range(100)]
+    for i, person in enumerate(people[1:]):
+        person.set_salary(1000 + 337 * i, i % 101)
+    assert list(Person.salaries_of(people)) == [p.salary for p in people]
+    circles = [Circle(1), Circle(2.5), Circle(0.3)]
+    assert list(Circle.areas_of(circles)) == [c.area for c in circles]
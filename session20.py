@@ -1,18 +1,80 @@
-from datetime import datetime
+from functools import lru_cache
 from typing import Union
+import atexit
+import json
 import math
+import os
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch helpers
+    np = None
+
+# The current year only changes once a year, so it is computed once at import
+# time instead of being looked up on every access.
+_CURRENT_YEAR = time.localtime().tm_year
+
+_PI = math.pi
+
+
+def refresh_current_year() -> int:
+    """
+    Recompute the cached current year.
+
+    Long-running processes can call this to pick up a year rollover.
+
+    Returns:
+        int: The refreshed current year.
+    """
+    global _CURRENT_YEAR
+    _CURRENT_YEAR = time.localtime().tm_year
+    return _CURRENT_YEAR
+
+
+def _validate_bonus(bonus):
+    """
+    Validate the bonus value to ensure it is within the acceptable range.
+
+    Parameters:
+    ----------
+    bonus : int or float
+        The bonus value to validate, expected to be in the range [0, 100].
+
+    Returns:
+    -------
+    int or float
+        The validated bonus value if it is within the range.
+
+    Raises:
+    ------
+    ValueError
+        If the bonus value is not numeric or not between 0 and 100 (inclusive).
+
+    """
+    t = type(bonus)
+    if t is not int and t is not float and not isinstance(bonus, (int, float)):
+        raise ValueError('Bonus must be of type int or float')
+    if not 0 <= bonus <= 100:
+        raise ValueError("Bonus must be between 0 and 100")
+    return bonus
+
 
 class Person:
     """
     A class representing a person with attributes such as name, age, year of birth, and salary details.
 
     Attributes:
-        _first_name (str): The first name of the person.
-        _last_name (str): The last name of the person.
+        first_name (str): The first name of the person.
+        last_name (str): The last name of the person.
         _yob (int): The year of birth of the person.
         _base_salary (int): The base salary of the person.
         _bonus (float): The bonus percentage of the salary.
+        _bonus_frac (float): Cached bonus fraction, bonus / 100.
     """
+    __slots__ = ('first_name', 'last_name', '_birth_year', '_base_salary', '_bonus', '_bonus_frac')
+
     def __init__(self, first_name: str = '', last_name: str = '', birth_year: int = None):
         """
         Initializes the Person instance.
@@ -22,16 +84,17 @@ class Person:
             last_name (str): The last name of the person (default: '').
             year (int): The year of birth of the person (default: None).
         """
-        self._first_name = first_name
-        self._last_name = last_name
+        self.first_name = first_name
+        self.last_name = last_name
         self._birth_year = birth_year
         self._base_salary = None
         self._bonus = None
+        self._bonus_frac = None
 
     @property
     def current_year(self):
         """Read-only property that returns the current year"""
-        return datetime.now().year
+        return _CURRENT_YEAR
 
     @property
     def age(self):
@@ -40,7 +103,7 @@ class Person:
             int: The age of the person based on their year of birth.
         """
         if self._birth_year is not None:
-            return self.current_year - self._birth_year
+            return _CURRENT_YEAR - self._birth_year
         return None
 
     def set_birth_year(self, year):
@@ -53,7 +116,7 @@ class Person:
         Raises:
             ValueError: If the year is not an integer.
         """
-        if not isinstance(year, int):
+        if type(year) is not int and not isinstance(year, int):
             raise ValueError('Year must be of type int')
         self._birth_year = year
 
@@ -63,7 +126,7 @@ class Person:
         Returns:
             str: The full name of the person.
         """
-        return f"{self._first_name} {self._last_name}".strip()
+        return f"{self.first_name} {self.last_name}".strip()
 
     @full_name.setter
     def full_name(self, name: str = None) -> None:
@@ -80,46 +143,14 @@ class Person:
             raise ValueError('Full name must be of type str')
 
         parts = name.split()
-        if len(parts) >= 2:
-            self._first_name = parts[0]
-            self._last_name = " ".join(parts[1:])
+        if len(parts) == 2:
+            self.first_name, self.last_name = parts
+        elif len(parts) > 2:
+            self.first_name = parts[0]
+            self.last_name = " ".join(parts[1:])
         else:
             raise ValueError("Full name must include both first and last name")
 
-    @property
-    def first_name(self) -> str:
-        """Returns the first name of the person."""
-        return self._first_name
-
-    @property
-    def last_name(self) -> str:
-        """Returns the last name of the person."""
-        return self._last_name
-
-    def _validate_bonus(self, bonus):
-        """
-        Validate the bonus value to ensure it is within the acceptable range.
-
-        Parameters:
-        ----------
-        bonus : int or float
-            The bonus value to validate, expected to be in the range [0, 100].
-
-        Returns:
-        -------
-        int or float
-            The validated bonus value if it is within the range.
-
-        Raises:
-        ------
-        ValueError
-            If the bonus value is not between 0 and 100 (inclusive).
-
-        """
-        if not 0 <= bonus <= 100:
-            raise ValueError("Bonus must be between 0 and 100")
-        return bonus
-
     @property
     def bonus(self):
         """
@@ -147,7 +178,8 @@ class Person:
         ValueError
             If the bonus value is not within the acceptable range.
         """
-        self._bonus = self._validate_bonus(value)
+        self._bonus = _validate_bonus(value)
+        self._bonus_frac = value / 100
 
     @property
     def base_salary(self) -> Union[int, None]:
@@ -172,15 +204,18 @@ class Person:
         Raises:
             ValueError: If the inputs are invalid.
         """
-        if not isinstance(base_salary, int):
+        if type(base_salary) is not int and not isinstance(base_salary, int):
             raise ValueError('Base Salary must be of type int')
-        if not isinstance(bonus, (int, float)):
+        t = type(bonus)
+        if t is not int and t is not float and not isinstance(bonus, (int, float)):
             raise ValueError('Bonus must be of type int or float')
         if base_salary < 0:
             raise ValueError('Base Salary must be non-negative')
-        self._validate_bonus(bonus)
+        if not 0 <= bonus <= 100:
+            raise ValueError("Bonus must be between 0 and 100")
         self._base_salary = base_salary
         self._bonus = bonus
+        self._bonus_frac = bonus / 100
 
     @property
     def salary(self) -> Union[float, int]:
@@ -196,14 +231,96 @@ class Person:
         Notes:
         ------
         - Total salary is calculated as:
-        `base_salary + (base_salary * (bonus / 100))`.
+        `base_salary + (base_salary * (bonus / 100))`, with `bonus / 100`
+        cached whenever the bonus is set.
         - If either `base_salary` or `bonus` is None, returns 0.
         """
-        if self._base_salary is not None and self._bonus is not None:
-            bonus_amount = self._base_salary * (self._bonus / 100)
-            return self._base_salary + bonus_amount
+        base_salary = self._base_salary
+        if base_salary is not None and self._bonus_frac is not None:
+            return base_salary + base_salary * self._bonus_frac
         return 0
 
+    @classmethod
+    def salaries_of(cls, people):
+        """
+        Compute the total salary of many people in one vectorized pass.
+
+        Parameters:
+        ----------
+        people : Sequence[Person]
+            The people whose salaries should be computed.
+
+        Returns:
+        -------
+        numpy.ndarray
+            Float array of total salaries, 0 where base salary or bonus is not set.
+
+        Raises:
+        ------
+        ImportError
+            If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("numpy is required for Person.salaries_of")
+        n = len(people)
+        base = np.fromiter(
+            (p._base_salary if p._base_salary is not None and p._bonus is not None else 0
+             for p in people),
+            dtype=np.int64, count=n)
+        bonus = np.fromiter(
+            (p._bonus if p._bonus is not None else 0 for p in people),
+            dtype=np.float64, count=n)
+        import _kernels  # deferred so importing this module never loads numba
+        if _kernels.salaries is not None:
+            return _kernels.salaries(base, bonus)
+        return base + base * (bonus / 100)
+
+
+# Opt-in radius -> area memo shared by all circles, see enable_area_memo()
+_AREA_MEMO = None
+# File the memo is written back to on interpreter exit, if any
+_AREA_MEMO_PATH = None
+# Upper bound on memo entries; the least recently used entry is evicted once it is full
+_AREA_MEMO_MAXSIZE = 4096
+
+
+def enable_area_memo(path: str = None) -> None:
+    """
+    Enable a process-wide radius -> area memo shared by all Circle instances.
+
+    Args:
+        path (str): Optional JSON file used to persist the memo across runs.
+            It is loaded now if it exists and written back on interpreter
+            exit. Any previously enabled path is no longer written.
+    """
+    global _AREA_MEMO, _AREA_MEMO_PATH
+    disable_area_memo()
+    memo = {}
+    if path is not None:
+        if os.path.exists(path):
+            with open(path) as f:
+                entries = json.load(f)
+            memo.update((radius, area) for radius, area in entries[-_AREA_MEMO_MAXSIZE:])
+        _AREA_MEMO_PATH = path
+        atexit.register(_save_area_memo)
+    _AREA_MEMO = memo
+
+
+def disable_area_memo() -> None:
+    """Disable the shared area memo; circles fall back to their own cache."""
+    global _AREA_MEMO, _AREA_MEMO_PATH
+    if _AREA_MEMO_PATH is not None:
+        atexit.unregister(_save_area_memo)
+    _AREA_MEMO = None
+    _AREA_MEMO_PATH = None
+
+
+def _save_area_memo() -> None:
+    """Write the shared area memo to its registered path as [radius, area] pairs."""
+    if _AREA_MEMO is not None and _AREA_MEMO_PATH is not None:
+        with open(_AREA_MEMO_PATH, 'w') as f:
+            json.dump(list(_AREA_MEMO.items()), f)
+
 
 class Circle:
     """
@@ -216,6 +333,8 @@ class Circle:
     _area : float or None
         Cached value of the circle's area, recalculated when radius changes.
     """
+    __slots__ = ('_radius', '_area')
+
     def __init__(self, radius: float):
         """
         Initialize the Circle with a given radius.
@@ -229,31 +348,6 @@ class Circle:
         self._area = None    # Cache for area
         # self.set_radius(radius)  # Use setter for initial validation
 
-    def _validate_radius(self, radius: float) -> None:
-        """
-        Validate that the radius is positive and numeric.
-
-        Parameters:
-        ----------
-        radius : float
-            The radius to validate.
-
-        Returns:
-        -------
-        float
-            The validated radius.
-
-        Raises:
-        ------
-        ValueError
-            If the radius is not numeric or is not positive.
-        """
-        if not isinstance(radius, (int, float)):
-            raise ValueError("Radius must be either int or float")
-        if radius <= 0:
-            raise ValueError("Radius must be positive")
-        return radius
-
     @property
     def radius(self) -> float:
         """
@@ -281,9 +375,12 @@ class Circle:
         ValueError
             If the radius is invalid.
         """
-        if not isinstance(radius, (int, float)):
-            raise ValueError('Radius must be either int or float')
-        self._radius = self._validate_radius(radius)
+        t = type(radius)
+        if t is not int and t is not float and not isinstance(radius, (int, float)):
+            raise ValueError("Radius must be either int or float")
+        if radius <= 0:
+            raise ValueError("Radius must be positive")
+        self._radius = radius
         self._area = None
 
     @property
@@ -313,8 +410,11 @@ class Circle:
         ValueError
             If the diameter is invalid.
         """
-        if not isinstance(diameter, (int, float)):
+        t = type(diameter)
+        if t is not int and t is not float and not isinstance(diameter, (int, float)):
             raise ValueError('Diameter must be either int or float')
+        if diameter <= 0:
+            raise ValueError('Diameter must be positive')
         self._radius = diameter / 2
         self._area = None
 
@@ -328,10 +428,54 @@ class Circle:
         float
             The area of the circle, calculated as π * radius^2.
         """
+        memo = _AREA_MEMO
+        if memo is not None:
+            r = self._radius
+            # Re-insert on every lookup so dict order tracks recency (LRU)
+            try:
+                area = memo.pop(r)
+            except KeyError:
+                if len(memo) >= _AREA_MEMO_MAXSIZE:
+                    del memo[next(iter(memo))]
+                area = _PI * r * r
+            memo[r] = area
+            return area
         if self._area is None:
-            self._area = math.pi * self._radius ** 2
+            r = self._radius
+            self._area = _PI * r * r
         return self._area
 
+    @classmethod
+    def areas_of(cls, circles):
+        """
+        Compute the area of many circles in one vectorized pass.
+
+        Parameters:
+        ----------
+        circles : Sequence[Circle]
+            The circles whose areas should be computed.
+
+        Returns:
+        -------
+        numpy.ndarray
+            Float array of areas, calculated as π * radius^2.
+
+        Raises:
+        ------
+        ImportError
+            If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("numpy is required for Circle.areas_of")
+        r = np.fromiter((c._radius for c in circles), dtype=np.float64, count=len(circles))
+        import _kernels  # deferred so importing this module never loads numba
+        if _kernels.areas is not None:
+            return _kernels.areas(r)
+        return np.pi * r * r
+
+_BASE_TYPES = ("car", "truck", "motorcycle")
+
+
 class Vehicle:
     """
     A class representing a generic vehicle.
@@ -340,6 +484,10 @@ class Vehicle:
     ----------
     vehicle_count : int
         Class variable tracking the total number of vehicle instances.
+    _count_lock : threading.Lock
+        Class-level lock guarding updates to vehicle_count.
+    _TYPE_PREFIX : str
+        Article and qualifier placed before the type in classify_vehicle.
     _manufacturer : str
         The manufacturer of the vehicle.
     _model : str
@@ -348,7 +496,10 @@ class Vehicle:
         The manufacturing year of the vehicle.
     """
     vehicle_count = 0
-    
+    _count_lock = threading.Lock()
+    _TYPE_PREFIX = "a "
+    __slots__ = ('_manufacturer', '_model', '_year')
+
     def __init__(self, manufacturer: str, model: str, year: int):
         """
         Initialize a new vehicle instance.
@@ -365,8 +516,10 @@ class Vehicle:
         self._manufacturer = manufacturer
         self._model = model
         self._year = year
-        # Increment the vehicle count when a new instance is created
-        Vehicle.vehicle_count += 1
+        # Increment the vehicle count when a new instance is created; the lock
+        # keeps the read-modify-write atomic across threads
+        with Vehicle._count_lock:
+            Vehicle.vehicle_count += 1
     
     @classmethod
     def get_vehicle_count(cls) -> int:
@@ -380,8 +533,9 @@ class Vehicle:
         """
         return cls.vehicle_count
     
-    @staticmethod
-    def classify_vehicle(vehicle_type: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=32)
+    def classify_vehicle(cls, vehicle_type: str) -> str:
         """
         Classify the vehicle type.
 
@@ -401,69 +555,17 @@ class Vehicle:
             If the vehicle type is invalid.
         """
         vehicle_type = vehicle_type.lower()
-        valid_types = {
-            "car": "This is a car",
-            "truck": "This is a truck",
-            "motorcycle": "This is a motorcycle"
-        }
-        
-        if vehicle_type not in valid_types:
+        if vehicle_type not in _BASE_TYPES:
             raise ValueError("Invalid vehicle type. Must be 'car', 'truck', or 'motorcycle'")
-        
-        return valid_types[vehicle_type]
+        return f"This is {cls._TYPE_PREFIX}{vehicle_type}"
 
 
 class ElectricVehicle(Vehicle):
     """
     A class representing an electric vehicle, inheriting from Vehicle.
     """
-    def __init__(self, manufacturer: str, model: str, year: int):
-        """
-        Initialize a new electric vehicle instance.
-
-        Parameters:
-        ----------
-        manufacturer : str
-            The manufacturer of the electric vehicle.
-        model : str
-            The model of the electric vehicle.
-        year : int
-            The manufacturing year of the electric vehicle.
-        """
-        super().__init__(manufacturer, model, year)
-    
-    @staticmethod
-    def classify_vehicle(vehicle_type: str) -> str:
-        """
-        Classify the type of electric vehicle.
-
-        Parameters:
-        ----------
-        vehicle_type : str
-            The type of the electric vehicle (e.g., 'car', 'truck', 'motorcycle').
-
-        Returns:
-        -------
-        str
-            A description of the electric vehicle type.
-
-        Raises:
-        ------
-        ValueError
-            If the vehicle type is invalid.
-        """
-        vehicle_type = vehicle_type.lower()
-        valid_types = {
-            "car": "This is an electric car",
-            "truck": "This is an electric truck",
-            "motorcycle": "This is an electric motorcycle"
-        }
-        
-        if vehicle_type not in valid_types:
-            raise ValueError("Invalid vehicle type. Must be 'car', 'truck', or 'motorcycle'")
-        
-        return valid_types[vehicle_type]
-
+    _TYPE_PREFIX = "an electric "
+    __slots__ = ()
 
 
 class ValidatedAttribute:
@@ -474,6 +576,8 @@ class ValidatedAttribute:
         _value (Union[int, float]): The validated value.
     """
 
+    __slots__ = ('_value',)
+
     def __init__(self, value: Union[int, float] = None) -> None:
         """Initializes the ValidatedAttribute instance."""
         self._value = None
@@ -494,7 +598,8 @@ class ValidatedAttribute:
         Raises:
             ValueError: If the value is invalid.
         """
-        if not isinstance(value, (int, float)):
+        t = type(value)
+        if t is not int and t is not float and not isinstance(value, (int, float)):
             raise ValueError('Value must be either int or float')
         if value <= 0:
             raise ValueError('Value must be positive')